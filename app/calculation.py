@@ -3,13 +3,20 @@
 Calculation class to represent a single calculation.
 """
 
+import time
 from datetime import datetime
+from typing import Optional
 from app.operations import Operation
 
 
 class Calculation:
     """Represents a single calculation with operation, operands, and result."""
     
+    # Fixed attribute layout: histories hold up to max_history_size of
+    # these, and slots cut per-instance memory versus a __dict__.
+    __slots__ = ('operation', 'operand_a', 'operand_b', 'result',
+                 '_op_name', '_op_symbol', '_ts')
+    
     def __init__(self, operation: Operation, operand_a: float, operand_b: float):
         """
         Initialize a calculation.
@@ -23,24 +30,45 @@ class Calculation:
         self.operand_a = operand_a
         self.operand_b = operand_b
         self.result = None
-        self.timestamp = datetime.now()
+        # Store the raw epoch time; building a datetime is deferred until
+        # the timestamp is actually displayed or serialized.
+        self._ts = time.time()
+        # Cache the display name and symbol once; they are derived from the
+        # operation class and never change for the life of the calculation.
+        self._op_name = operation.__class__.__name__.replace('Operation', '').lower()
+        self._op_symbol = operation.get_symbol()
     
-    def execute(self) -> float:
+    def execute(self, precision: Optional[int] = None) -> float:
         """
         Execute the calculation and store the result.
         
+        Args:
+            precision: Decimal places to round the result to, or None
+        
         Returns:
             The result of the calculation
         """
-        self.result = self.operation.execute(self.operand_a, self.operand_b)
-        return self.result
+        result = self.operation.execute(self.operand_a, self.operand_b)
+        if precision is not None:
+            result = round(result, precision)
+        self.result = result
+        return result
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time of the calculation as a datetime."""
+        return datetime.fromtimestamp(self._ts)
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        """Set the creation time from a datetime."""
+        self._ts = value.timestamp()
     
     def __str__(self) -> str:
         """Return string representation of the calculation."""
-        operation_name = self.operation.__class__.__name__.replace('Operation', '').lower()
         if self.result is not None:
-            return f"{self.operand_a} {self.operation.get_symbol()} {self.operand_b} = {self.result}"
-        return f"{self.operand_a} {self.operation.get_symbol()} {self.operand_b}"
+            return f"{self.operand_a} {self._op_symbol} {self.operand_b} = {self.result}"
+        return f"{self.operand_a} {self._op_symbol} {self.operand_b}"
     
     def __repr__(self) -> str:
         """Return detailed representation of the calculation."""
@@ -53,11 +81,10 @@ class Calculation:
         Returns:
             Dictionary representation of the calculation
         """
-        operation_name = self.operation.__class__.__name__.replace('Operation', '').lower()
         return {
-            'operation': operation_name,
+            'operation': self._op_name,
             'operand_a': self.operand_a,
             'operand_b': self.operand_b,
             'result': self.result,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': datetime.fromtimestamp(self._ts).isoformat()
         }
@@ -2,15 +2,23 @@
 Main Calculator class with REPL interface and Observer pattern.
 """
 
+import atexit
+import csv
+import io
+import logging
+import os
+import sys
+import time
 from abc import ABC, abstractmethod
 from typing import List
 from app.calculation import Calculation
+from app import operations
 from app.operations import OperationFactory
 from app.history import CalculationHistory
 from app.calculator_memento import CalculatorCaretaker
-from app.calculator_config import CalculatorConfig
+from app.calculator_config import get_config
 from app.logger import Logger
-from app.input_validators import validate_number, validate_in_range
+from app.input_validators import validate_operand
 from app.exceptions import OperationError, ValidationError, HistoryError
 
 
@@ -22,6 +30,11 @@ class CalculationObserver(ABC):
     def update(self, calculation: Calculation) -> None:
         """Called when a new calculation is performed."""
         pass
+    
+    def update_batch(self, calculations: List[Calculation]) -> None:
+        """Called with all calculations accumulated since the last flush."""
+        for calculation in calculations:
+            self.update(calculation)
 
 
 class LoggingObserver(CalculationObserver):
@@ -32,8 +45,11 @@ class LoggingObserver(CalculationObserver):
     
     def update(self, calculation: Calculation) -> None:
         """Log the calculation details."""
+        # Skip argument construction entirely when INFO is filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.log_calculation(
-            calculation.operation.__class__.__name__.replace('Operation', '').lower(),
+            calculation._op_name,
             calculation.operand_a,
             calculation.operand_b,
             calculation.result
@@ -41,19 +57,72 @@ class LoggingObserver(CalculationObserver):
 
 
 class AutoSaveObserver(CalculationObserver):
-    """Observer that automatically saves history to CSV."""
+    """Observer that appends calculations to the CSV file in batches."""
+    
+    CSV_HEADER = ('operation', 'operand_a', 'operand_b', 'result', 'timestamp')
     
-    def __init__(self, history: CalculationHistory, filepath: str):
+    def __init__(self, history: CalculationHistory, filepath: str,
+                 batch_size: int = 16, flush_interval: float = 1.0):
         self.history = history
         self.filepath = filepath
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._file = None
+        self._writer = None
+        
+        # Make sure buffered calculations reach disk on interpreter exit
+        atexit.register(self.close)
     
     def update(self, calculation: Calculation) -> None:
-        """Auto-save history to CSV file."""
+        """Append the new calculation and flush once a batch has accumulated."""
         try:
-            if self.history.get_count() > 0:
-                self.history.save_to_csv(self.filepath)
-        except HistoryError:
-            pass  # Silently handle auto-save errors
+            if self._writer is None:
+                self._open_file()
+            self._writer.writerow(calculation.to_dict().values())
+        except OSError:
+            return  # Silently handle auto-save errors
+        self._pending += 1
+        if (self._pending >= self._batch_size
+                or time.monotonic() - self._last_flush > self._flush_interval):
+            self._flush()
+    
+    def _open_file(self) -> None:
+        """Open the CSV file in append mode, writing the header if new."""
+        dirname = os.path.dirname(self.filepath)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        write_header = (not os.path.exists(self.filepath)
+                        or os.path.getsize(self.filepath) == 0)
+        self._file = open(self.filepath, 'a', newline='', buffering=8192)
+        self._writer = csv.writer(self._file)
+        if write_header:
+            self._writer.writerow(self.CSV_HEADER)
+    
+    def _flush(self) -> None:
+        """Push any buffered rows out to disk."""
+        if self._file is not None:
+            try:
+                self._file.flush()
+            except OSError:
+                pass  # Silently handle auto-save errors
+        self._pending = 0
+        self._last_flush = time.monotonic()
+    
+    def close(self) -> None:
+        """Flush and close the CSV file."""
+        if self._file is not None:
+            self._flush()
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+            self._writer = None
+    
+    def __del__(self):
+        self.close()
 
 
 class Calculator:
@@ -61,11 +130,25 @@ class Calculator:
     
     def __init__(self):
         """Initialize the calculator with all components."""
-        self.config = CalculatorConfig()
+        self.config = get_config()
         self.logger = Logger()
         self.history = CalculationHistory(max_size=self.config.max_history_size)
-        self.caretaker = CalculatorCaretaker()
+        self.caretaker = CalculatorCaretaker(max_size=self.config.max_history_size)
         self.observers: List[CalculationObserver] = []
+        self._arith_ops = operations._AVAILABLE_SET
+        self._pending_calcs: List[Calculation] = []
+        self._defer_notify = False
+        
+        # Command-name -> handler table for O(1) REPL dispatch
+        self._commands = {
+            'help': self.show_help,
+            'history': self.show_history,
+            'clear': self.clear_history,
+            'undo': self._cmd_undo,
+            'redo': self._cmd_redo,
+            'save': self.save_history,
+            'load': self.load_history,
+        }
         
         # Register observers
         self.register_observer(LoggingObserver(self.logger))
@@ -83,6 +166,14 @@ class Calculator:
         for observer in self.observers:
             observer.update(calculation)
     
+    def flush_pending(self) -> None:
+        """Fan out all queued calculations to each observer in one pass."""
+        if not self._pending_calcs:
+            return
+        for observer in self.observers:
+            observer.update_batch(self._pending_calcs)
+        self._pending_calcs.clear()
+    
     def perform_calculation(self, operation_name: str, operand_a: float, operand_b: float) -> float:
         """
         Perform a calculation and update history.
@@ -96,41 +187,38 @@ class Calculator:
             Result of the calculation
         """
         # Validate inputs
-        operand_a = validate_number(operand_a, "operand_a")
-        operand_b = validate_number(operand_b, "operand_b")
-        validate_in_range(operand_a, self.config.max_input_value, "operand_a")
-        validate_in_range(operand_b, self.config.max_input_value, "operand_b")
-        
-        # Save state before performing calculation (for undo)
-        self.caretaker.save_state(self.history.get_history())
+        operand_a = validate_operand(operand_a, self.config.max_input_value, "operand_a")
+        operand_b = validate_operand(operand_b, self.config.max_input_value, "operand_b")
         
         # Create and execute calculation
         operation = OperationFactory.create_operation(operation_name)
         calculation = Calculation(operation, operand_a, operand_b)
-        result = calculation.execute()
+        result = calculation.execute(self.config.precision)
         
-        # Round result to configured precision
-        result = round(result, self.config.precision)
-        calculation.result = result
-        
-        # Add to history
+        # Add to history and record the append for undo
         self.history.add_calculation(calculation)
+        self.caretaker.record_append(calculation)
         
-        # Notify observers
-        self.notify_observers(calculation)
+        # Notify observers (queued for a batched flush inside the REPL)
+        if self._defer_notify:
+            self._pending_calcs.append(calculation)
+        else:
+            self.notify_observers(calculation)
         
         return result
     
     def undo(self) -> None:
         """Undo the last calculation."""
-        restored_history = self.caretaker.undo(self.history.get_history())
-        self.history._history = restored_history
+        if not self.history._history:
+            raise HistoryError("Nothing to undo")
+        self.caretaker.undo_append()
+        self.history._history.pop()
         self.logger.info("Undo performed")
     
     def redo(self) -> None:
         """Redo the last undone calculation."""
-        restored_history = self.caretaker.redo()
-        self.history._history = restored_history
+        calculation = self.caretaker.redo_append()
+        self.history._history.append(calculation)
         self.logger.info("Redo performed")
     
     def show_history(self) -> None:
@@ -147,6 +235,14 @@ class Calculator:
     def save_history(self) -> None:
         """Manually save history to CSV."""
         try:
+            # Close auto-save observers first: save_to_csv truncates and
+            # rewrites the file, so any rows still sitting in an observer's
+            # buffer must not replay into it afterwards. Closed observers
+            # reopen at the new EOF with an empty buffer on the next update.
+            for observer in self.observers:
+                if isinstance(observer, AutoSaveObserver):
+                    observer.close()
+            self.config.ensure_history_dir()
             self.history.save_to_csv(self.config.history_file)
             self.logger.info(f"History saved to {self.config.history_file}")
             print(f"History saved to {self.config.history_file}")
@@ -157,11 +253,33 @@ class Calculator:
         """Load history from CSV."""
         try:
             self.history.load_from_csv(self.config.history_file)
+            # Loaded rows were never recorded in the append log, so the
+            # undo/redo state no longer matches the history; drop it the
+            # same way clear_history does
+            self.caretaker.clear()
             self.logger.info(f"History loaded from {self.config.history_file}")
             print(f"History loaded from {self.config.history_file}")
         except HistoryError as e:
             print(f"Error: {e}")
     
+    def _cmd_undo(self) -> None:
+        """Handle the undo REPL command."""
+        try:
+            self.undo()
+            print("Undo successful")
+            self.show_history()
+        except HistoryError as e:
+            print(f"Error: {e}")
+    
+    def _cmd_redo(self) -> None:
+        """Handle the redo REPL command."""
+        try:
+            self.redo()
+            print("Redo successful")
+            self.show_history()
+        except HistoryError as e:
+            print(f"Error: {e}")
+    
     def show_help(self) -> None:
         """Display available commands."""
         help_text = """
@@ -198,78 +316,73 @@ Other Commands:
         print("Calculator REPL - Type 'help' for available commands")
         self.logger.info("REPL started")
         
+        # Scratch buffer so each command's output is one stdout write
+        out = io.StringIO()
+        
+        # Queue observer notifications and fan them out once per command
+        self._defer_notify = True
+        
         while True:
             try:
-                user_input = input("> ").strip().lower()
+                user_input = input("> ").strip()
                 
                 if not user_input:
                     continue
                 
-                parts = user_input.split()
-                command = parts[0]
+                # At most 4 tokens matter (command + 2 operands + excess
+                # marker), so stop scanning early instead of tokenizing
+                # the whole line
+                parts = user_input.split(maxsplit=3)
+                
+                # Only the command token needs normalizing; operands are
+                # numbers and lowercasing the full line would copy it again
+                command = parts[0].lower()
                 
                 # Exit command
                 if command == "exit":
                     print("Goodbye!")
                     self.logger.info("Calculator exiting")
+                    self.flush_pending()
+                    for observer in self.observers:
+                        if isinstance(observer, AutoSaveObserver):
+                            observer._flush()
                     break
                 
-                # Help command
-                elif command == "help":
-                    self.show_help()
-                
-                # History commands
-                elif command == "history":
-                    self.show_history()
-                
-                elif command == "clear":
-                    self.clear_history()
-                
-                elif command == "undo":
-                    try:
-                        self.undo()
-                        print("Undo successful")
-                        self.show_history()
-                    except HistoryError as e:
-                        print(f"Error: {e}")
-                
-                elif command == "redo":
-                    try:
-                        self.redo()
-                        print("Redo successful")
-                        self.show_history()
-                    except HistoryError as e:
-                        print(f"Error: {e}")
-                
-                elif command == "save":
-                    self.save_history()
-                
-                elif command == "load":
-                    self.load_history()
+                # Built-in commands via table lookup
+                handler = self._commands.get(command)
+                if handler is not None:
+                    handler()
                 
                 # Arithmetic operations
-                elif command in OperationFactory.get_available_operations():
+                elif command in self._arith_ops:
                     if len(parts) != 3:
-                        print(f"Error: {command} requires exactly 2 numbers")
-                        print(f"Usage: {command} <number1> <number2>")
-                        continue
-                    
-                    try:
-                        result = self.perform_calculation(command, parts[1], parts[2])
-                        print(f"Result: {result}")
-                    except (OperationError, ValidationError) as e:
-                        print(f"Error: {e}")
-                        self.logger.error(str(e))
+                        out.write(f"Error: {command} requires exactly 2 numbers\n")
+                        out.write(f"Usage: {command} <number1> <number2>\n")
+                    else:
+                        try:
+                            result = self.perform_calculation(command, parts[1], parts[2])
+                            out.write(f"Result: {result}\n")
+                        except (OperationError, ValidationError) as e:
+                            out.write(f"Error: {e}\n")
+                            self.logger.error(str(e))
                 
                 else:
-                    print(f"Unknown command: {command}")
-                    print("Type 'help' for available commands")
+                    out.write(f"Unknown command: {command}\n")
+                    out.write("Type 'help' for available commands\n")
             
             except KeyboardInterrupt:
                 print("\nUse 'exit' to quit")
             except Exception as e:
                 print(f"Unexpected error: {e}")
                 self.logger.error(f"Unexpected error: {e}")
+            
+            self.flush_pending()
+            
+            # Emit everything buffered this iteration in a single write
+            if out.tell():
+                sys.stdout.write(out.getvalue())
+                out.seek(0)
+                out.truncate()
 
 
 def main():
@@ -2,8 +2,8 @@
 Memento pattern implementation for undo/redo functionality.
 """
 
+from collections import deque
 from typing import List, Optional
-from copy import deepcopy
 from app.calculation import Calculation
 from app.exceptions import HistoryError
 
@@ -18,18 +18,20 @@ class CalculatorMemento:
         Initialize memento with a history snapshot.
         
         Args:
-            history_snapshot: Deep copy of calculation history
+            history_snapshot: Calculation history to snapshot
         """
-        self._history_snapshot = deepcopy(history_snapshot)
+        # Calculations are never mutated after execute(), so an immutable
+        # tuple of references is a safe snapshot — no deep copies needed.
+        self._history_snapshot = tuple(history_snapshot)
     
     def get_snapshot(self) -> List[Calculation]:
         """
         Get the stored history snapshot.
         
         Returns:
-            Deep copy of the snapshot
+            List copy of the snapshot
         """
-        return deepcopy(self._history_snapshot)
+        return list(self._history_snapshot)
 
 
 class CalculatorCaretaker:
@@ -37,10 +39,15 @@ class CalculatorCaretaker:
     Caretaker class that manages undo/redo operations using mementos.
     """
     
-    def __init__(self):
-        """Initialize the caretaker with empty undo/redo stacks."""
-        self._undo_stack: List[CalculatorMemento] = []
-        self._redo_stack: List[CalculatorMemento] = []
+    def __init__(self, max_size: int = 100):
+        """
+        Initialize the caretaker with empty, bounded undo/redo stacks.
+        
+        Args:
+            max_size: Maximum number of states to retain on each stack
+        """
+        self._undo_stack: deque = deque(maxlen=max_size)
+        self._redo_stack: deque = deque(maxlen=max_size)
     
     def save_state(self, history: List[Calculation]) -> None:
         """
@@ -100,6 +107,56 @@ class CalculatorCaretaker:
         
         return next_memento.get_snapshot()
     
+    def record_append(self, calculation: Calculation) -> None:
+        """
+        Record that a calculation was appended to the history.
+        
+        For an append-only history this stores just the appended
+        calculation instead of a full snapshot, so each undo step costs
+        O(1) memory rather than O(history length).
+        
+        Args:
+            calculation: The calculation that was just appended
+        """
+        self._undo_stack.append(calculation)
+        
+        # Clear redo stack when new state is saved
+        self._redo_stack.clear()
+    
+    def undo_append(self) -> Calculation:
+        """
+        Undo the most recently recorded append.
+        
+        Returns:
+            The calculation that should be removed from the history
+        
+        Raises:
+            HistoryError: If there's nothing to undo
+        """
+        if not self._undo_stack:
+            raise HistoryError("Nothing to undo")
+        
+        calculation = self._undo_stack.pop()
+        self._redo_stack.append(calculation)
+        return calculation
+    
+    def redo_append(self) -> Calculation:
+        """
+        Redo the most recently undone append.
+        
+        Returns:
+            The calculation that should be re-appended to the history
+        
+        Raises:
+            HistoryError: If there's nothing to redo
+        """
+        if not self._redo_stack:
+            raise HistoryError("Nothing to redo")
+        
+        calculation = self._redo_stack.pop()
+        self._undo_stack.append(calculation)
+        return calculation
+    
     def can_undo(self) -> bool:
         """
         Check if undo is available.
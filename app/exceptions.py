@@ -15,7 +15,21 @@ class OperationError(CalculatorError):
 
 class ValidationError(CalculatorError):
     """Raised when input validation fails."""
-    pass
+    
+    # Message templates for the common REPL failure paths, built once at
+    # class level so raising reuses them with cheap %-formatting
+    NOT_A_NUMBER = "%s must be a number, got '%s'"
+    EXCEEDS_MAX = "%s exceeds maximum allowed value of %s"
+    
+    @classmethod
+    def not_a_number(cls, param_name, value):
+        """Build the standard not-a-number error."""
+        return cls(cls.NOT_A_NUMBER % (param_name, value))
+    
+    @classmethod
+    def exceeds_max(cls, param_name, max_value):
+        """Build the standard out-of-range error."""
+        return cls(cls.EXCEEDS_MAX % (param_name, max_value))
 
 
 class HistoryError(CalculatorError):
@@ -3,7 +3,8 @@ History management for calculator calculations.
 Handles storing, saving, and loading calculation history using pandas.
 """
 
-import pandas as pd
+import csv
+from collections import deque
 from datetime import datetime
 from typing import List, Optional
 from app.calculation import Calculation
@@ -21,7 +22,9 @@ class CalculationHistory:
         Args:
             max_size: Maximum number of calculations to store
         """
-        self._history: List[Calculation] = []
+        # deque(maxlen=...) evicts the oldest entry in O(1); list.pop(0)
+        # shifted every remaining element on overflow
+        self._history: deque = deque(maxlen=max_size)
         self._max_size = max_size
     
     def add_calculation(self, calculation: Calculation) -> None:
@@ -32,10 +35,6 @@ class CalculationHistory:
             calculation: The calculation to add
         """
         self._history.append(calculation)
-        
-        # Remove oldest if exceeding max size
-        if len(self._history) > self._max_size:
-            self._history.pop(0)
     
     def get_history(self) -> List[Calculation]:
         """
@@ -44,7 +43,7 @@ class CalculationHistory:
         Returns:
             List of calculations
         """
-        return self._history.copy()
+        return list(self._history)
     
     def get_last_calculation(self) -> Optional[Calculation]:
         """
@@ -76,7 +75,7 @@ class CalculationHistory:
         
         Args:
             filepath: Path to the CSV file
-            
+        
         Raises:
             HistoryError: If saving fails
         """
@@ -84,12 +83,17 @@ class CalculationHistory:
             raise HistoryError("No history to save")
         
         try:
-            # Convert calculations to list of dictionaries
-            data = [calc.to_dict() for calc in self._history]
-            
-            # Create DataFrame and save to CSV
-            df = pd.DataFrame(data)
-            df.to_csv(filepath, index=False)
+            # Plain csv.writer is far cheaper than building a DataFrame
+            # just to serialize a handful of scalar columns; reading the
+            # fields directly also skips a dict build per row
+            with open(filepath, 'w', newline='', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(('operation', 'operand_a', 'operand_b',
+                                 'result', 'timestamp'))
+                writer.writerows(
+                    (calc._op_name, calc.operand_a, calc.operand_b,
+                     calc.result, datetime.fromtimestamp(calc._ts).isoformat())
+                    for calc in self._history)
         except Exception as e:
             raise HistoryError(f"Failed to save history to CSV: {str(e)}")
     
@@ -99,192 +103,54 @@ class CalculationHistory:
         
         Args:
             filepath: Path to the CSV file
-            
-        Raises:
-            HistoryError: If loading fails
-        """
-        try:
-            # Read CSV into DataFrame
-            df = pd.read_csv(filepath)
-            
-            # Clear existing history
-            self._history.clear()
-            
-            # Convert each row back to a Calculation object
-            for _, row in df.iterrows():
-                try:
-                    # Create operation from factory
-                    operation = OperationFactory.create_operation(row['operation'])
-                    
-                    # Create calculation
-                    calc = Calculation(operation, float(row['operand_a']), float(row['operand_b']))
-                    
-                    # Set result and timestamp
-                    calc.result = float(row['result'])
-                    calc.timestamp = pd.to_datetime(row['timestamp'])
-                    
-                    # Add to history
-                    self._history.append(calc)
-                except Exception as e:
-                    # Skip invalid rows but continue loading
-                    continue
-            
-            # Enforce max size
-            if len(self._history) > self._max_size:
-                self._history = self._history[-self._max_size:]
-                
-        except FileNotFoundError:
-            raise HistoryError(f"History file not found: {filepath}")
-        except Exception as e:
-            raise HistoryError(f"Failed to load history from CSV: {str(e)}")
-    
-    def __str__(self) -> str:
-        """Return string representation of history."""
-        if not self._history:
-            return "No calculations in history"
-        
-        lines = ["Calculation History:"]
-        for i, calc in enumerate(self._history, 1):
-            lines.append(f"{i}. {calc}")
-        return "\n".join(lines)
-    
-    def __repr__(self) -> str:
-        """Return detailed representation of history."""
-        return f"CalculationHistory(count={len(self._history)}, max_size={self._max_size})""""
-History management for calculator calculations.
-Handles storing, saving, and loading calculation history using pandas.
-"""
-
-import pandas as pd
-from datetime import datetime
-from typing import List, Optional
-from app.calculation import Calculation
-from app.operations import OperationFactory
-from app.exceptions import HistoryError
-
-
-class CalculationHistory:
-    """Manages the history of calculations."""
-    
-    def __init__(self, max_size: int = 100):
-        """
-        Initialize calculation history.
-        
-        Args:
-            max_size: Maximum number of calculations to store
-        """
-        self._history: List[Calculation] = []
-        self._max_size = max_size
-    
-    def add_calculation(self, calculation: Calculation) -> None:
-        """
-        Add a calculation to history.
         
-        Args:
-            calculation: The calculation to add
-        """
-        self._history.append(calculation)
-        
-        # Remove oldest if exceeding max size
-        if len(self._history) > self._max_size:
-            self._history.pop(0)
-    
-    def get_history(self) -> List[Calculation]:
-        """
-        Get the full calculation history.
-        
-        Returns:
-            List of calculations
-        """
-        return self._history.copy()
-    
-    def get_last_calculation(self) -> Optional[Calculation]:
-        """
-        Get the most recent calculation.
-        
-        Returns:
-            The last calculation or None if history is empty
-        """
-        if not self._history:
-            return None
-        return self._history[-1]
-    
-    def clear_history(self) -> None:
-        """Clear all calculation history."""
-        self._history.clear()
-    
-    def get_count(self) -> int:
-        """
-        Get the number of calculations in history.
-        
-        Returns:
-            Number of calculations
-        """
-        return len(self._history)
-    
-    def save_to_csv(self, filepath: str) -> None:
-        """
-        Save calculation history to a CSV file using pandas.
-        
-        Args:
-            filepath: Path to the CSV file
-            
         Raises:
-            HistoryError: If saving fails
+            HistoryError: If loading fails
         """
-        if not self._history:
-            raise HistoryError("No history to save")
+        # Imported here so REPL startup and save-only workflows never
+        # pay the pandas import cost; repeat calls hit sys.modules
+        import pandas as pd
         
         try:
-            # Convert calculations to list of dictionaries
-            data = [calc.to_dict() for calc in self._history]
+            # Read CSV into DataFrame through a large read buffer; the
+            # numeric columns are coerced afterwards rather than via a
+            # strict dtype= schema so a single malformed cell drops its
+            # row instead of aborting the whole load
+            with open(filepath, 'r', buffering=1 << 20) as f:
+                df = pd.read_csv(f, engine='c', dtype={'operation': str})
             
-            # Create DataFrame and save to CSV
-            df = pd.DataFrame(data)
-            df.to_csv(filepath, index=False)
-        except Exception as e:
-            raise HistoryError(f"Failed to save history to CSV: {str(e)}")
-    
-    def load_from_csv(self, filepath: str) -> None:
-        """
-        Load calculation history from a CSV file using pandas.
-        
-        Args:
-            filepath: Path to the CSV file
-            
-        Raises:
-            HistoryError: If loading fails
-        """
-        try:
-            # Read CSV into DataFrame
-            df = pd.read_csv(filepath)
+            # Vectorized per-column coercion keeps the skip-invalid-rows
+            # behavior without a Python-level try per cell
+            for column in ('operand_a', 'operand_b', 'result'):
+                df[column] = pd.to_numeric(df[column], errors='coerce')
+            df['timestamp'] = pd.to_datetime(df['timestamp'],
+                                             errors='coerce')
+            df = df.dropna(subset=['operand_a', 'operand_b', 'result',
+                                   'timestamp'])
             
             # Clear existing history
             self._history.clear()
             
-            # Convert each row back to a Calculation object
-            for _, row in df.iterrows():
+            # Pull each column out once as a plain array; iterrows would
+            # box every cell into a Python scalar plus a Series per row
+            ops = df['operation'].to_numpy()
+            operands_a = df['operand_a'].to_numpy()
+            operands_b = df['operand_b'].to_numpy()
+            results = df['result'].to_numpy()
+            timestamps = df['timestamp'].to_list()
+            
+            for i in range(len(df)):
                 try:
-                    # Create operation from factory
-                    operation = OperationFactory.create_operation(row['operation'])
-                    
-                    # Create calculation
-                    calc = Calculation(operation, float(row['operand_a']), float(row['operand_b']))
-                    
-                    # Set result and timestamp
-                    calc.result = float(row['result'])
-                    calc.timestamp = pd.to_datetime(row['timestamp'])
-                    
-                    # Add to history
+                    operation = OperationFactory.create_operation(ops[i])
+                    calc = Calculation(operation, operands_a[i],
+                                       operands_b[i])
+                    calc.result = results[i]
+                    calc.timestamp = timestamps[i]
                     self._history.append(calc)
-                except Exception as e:
+                except Exception:
                     # Skip invalid rows but continue loading
                     continue
-            
-            # Enforce max size
-            if len(self._history) > self._max_size:
-                self._history = self._history[-self._max_size:]
-                
+        
         except FileNotFoundError:
             raise HistoryError(f"History file not found: {filepath}")
         except Exception as e:
@@ -19,10 +19,14 @@ def validate_number(value, param_name: str = "value") -> float:
     Raises:
         ValidationError: If value is not a number
     """
+    # Fast path: real numbers convert without touching the exception
+    # machinery (bool is excluded since it is an int subclass)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
     try:
         return float(value)
     except (ValueError, TypeError):
-        raise ValidationError(f"{param_name} must be a number, got '{value}'")
+        raise ValidationError.not_a_number(param_name, value)
 
 
 def validate_in_range(value: float, max_value: float, param_name: str = "value") -> None:
@@ -38,7 +42,37 @@ def validate_in_range(value: float, max_value: float, param_name: str = "value")
         ValidationError: If value exceeds max_value
     """
     if abs(value) > max_value:
-        raise ValidationError(f"{param_name} exceeds maximum allowed value of {max_value}")
+        raise ValidationError.exceeds_max(param_name, max_value)
+
+
+def validate_operand(value, max_value: float, param_name: str = "value") -> float:
+    """
+    Validate that a value is a number within the allowed range.
+    
+    Fuses validate_number and validate_in_range into a single call for
+    the calculation hot path.
+    
+    Args:
+        value: The value to validate
+        max_value: Maximum allowed absolute value
+        param_name: Name of the parameter for error messages
+        
+    Returns:
+        The value as a float
+        
+    Raises:
+        ValidationError: If value is not a number or exceeds max_value
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        value = float(value)
+    else:
+        try:
+            value = float(value)
+        except (ValueError, TypeError):
+            raise ValidationError.not_a_number(param_name, value)
+    if abs(value) > max_value:
+        raise ValidationError.exceeds_max(param_name, max_value)
+    return value
 
 
 def validate_not_zero(value: float, param_name: str = "value") -> None:
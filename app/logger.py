@@ -4,7 +4,10 @@ Logging configuration for the calculator application.
 
 import logging
 import os
-from datetime import datetime
+import threading
+from logging.handlers import RotatingFileHandler
+
+from app.calculator_config import get_config
 
 
 class Logger:
@@ -12,40 +15,51 @@ class Logger:
     
     _instance = None
     _logger = None
+    _lock = threading.Lock()
     
     def __new__(cls):
         """Singleton pattern to ensure only one logger instance."""
         if cls._instance is None:
-            cls._instance = super(Logger, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(Logger, cls).__new__(cls)
         return cls._instance
     
     def __init__(self):
         """Initialize the logger if not already initialized."""
         if self._logger is None:
-            self._setup_logger()
+            with self._lock:
+                if Logger._logger is None:
+                    self._setup_logger()
+        if 'info' not in self.__dict__:
+            self._bind_direct_methods()
     
-    def _setup_logger(self, log_dir: str = "logs", log_file: str = "calculator.log"):
+    def _setup_logger(self):
         """
         Set up the logger with file and console handlers.
         
-        Args:
-            log_dir: Directory to store log files
-            log_file: Name of the log file
+        The log location comes from the shared config so redirected
+        configs (e.g. per-worker test dirs) are honored.
         """
-        # Create logs directory if it doesn't exist
-        os.makedirs(log_dir, exist_ok=True)
+        # Resolve the shared logger and bail out before creating
+        # anything if it is already configured, so a racing second
+        # call can never attach duplicate handlers (which would
+        # double every write)
+        logger = logging.getLogger('calculator')
+        if logger.handlers:
+            Logger._logger = logger
+            return
         
-        # Create logger
-        self._logger = logging.getLogger('calculator')
-        self._logger.setLevel(logging.DEBUG)
+        # Create the log directory if it doesn't exist
+        config = get_config()
+        config.ensure_log_dir()
         
-        # Prevent duplicate handlers
-        if self._logger.handlers:
-            return
+        logger.setLevel(logging.DEBUG)
         
-        # Create file handler
-        log_path = os.path.join(log_dir, log_file)
-        file_handler = logging.FileHandler(log_path)
+        # Create file handler; delay=True defers opening the file until
+        # the first record is actually written
+        file_handler = RotatingFileHandler(config.log_file, maxBytes=1 << 20,
+                                           backupCount=3, delay=True)
         file_handler.setLevel(logging.DEBUG)
         
         # Create console handler
@@ -63,104 +77,23 @@ class Logger:
         console_handler.setFormatter(formatter)
         
         # Add handlers to logger
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
-    
-    def info(self, message: str):
-        """Log an info message."""
-        self._logger.info(message)
-    
-    def warning(self, message: str):
-        """Log a warning message."""
-        self._logger.warning(message)
-    
-    def error(self, message: str):
-        """Log an error message."""
-        self._logger.error(message)
-    
-    def debug(self, message: str):
-        """Log a debug message."""
-        self._logger.debug(message)
+        logger.addHandler(file_handler)
+        logger.addHandler(console_handler)
+        Logger._logger = logger
     
-    def log_calculation(self, operation: str, operand_a: float, operand_b: float, result: float):
-        """
-        Log a calculation with details.
-        
-        Args:
-            operation: Name of the operation
-            operand_a: First operand
-            operand_b: Second operand
-            result: Result of the calculation
-        """
-        self.info(f"Calculation: {operand_a} {operation} {operand_b} = {result}")
+    def _bind_direct_methods(self):
+        """Bind the stdlib logger's methods onto the instance.
         
+        Each wrapper method below costs an extra Python frame per
+        call; binding the underlying methods directly makes
+        logger.info(...) a single C-level dispatch. The methods are
+        kept as fallbacks and for documentation.
         """
-Logging configuration for the calculator application.
-"""
-
-import logging
-import os
-from datetime import datetime
-
-
-class Logger:
-    """Manages logging for the calculator application."""
-    
-    _instance = None
-    _logger = None
-    
-    def __new__(cls):
-        """Singleton pattern to ensure only one logger instance."""
-        if cls._instance is None:
-            cls._instance = super(Logger, cls).__new__(cls)
-        return cls._instance
-    
-    def __init__(self):
-        """Initialize the logger if not already initialized."""
-        if self._logger is None:
-            self._setup_logger()
-    
-    def _setup_logger(self, log_dir: str = "logs", log_file: str = "calculator.log"):
-        """
-        Set up the logger with file and console handlers.
-        
-        Args:
-            log_dir: Directory to store log files
-            log_file: Name of the log file
-        """
-        # Create logs directory if it doesn't exist
-        os.makedirs(log_dir, exist_ok=True)
-        
-        # Create logger
-        self._logger = logging.getLogger('calculator')
-        self._logger.setLevel(logging.DEBUG)
-        
-        # Prevent duplicate handlers
-        if self._logger.handlers:
-            return
-        
-        # Create file handler
-        log_path = os.path.join(log_dir, log_file)
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setLevel(logging.DEBUG)
-        
-        # Create console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        # Add formatter to handlers
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
-        
-        # Add handlers to logger
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
+        self.info = self._logger.info
+        self.warning = self._logger.warning
+        self.error = self._logger.error
+        self.debug = self._logger.debug
+        self.isEnabledFor = self._logger.isEnabledFor
     
     def info(self, message: str):
         """Log an info message."""
@@ -178,6 +111,10 @@ class Logger:
         """Log a debug message."""
         self._logger.debug(message)
     
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether the underlying logger handles the given level."""
+        return self._logger.isEnabledFor(level)
+    
     def log_calculation(self, operation: str, operand_a: float, operand_b: float, result: float):
         """
         Log a calculation with details.
@@ -188,4 +125,6 @@ class Logger:
             operand_b: Second operand
             result: Result of the calculation
         """
-        self.info(f"Calculation: {operand_a} {operation} {operand_b} = {result}")
+        # %-style args defer string building until the record is emitted
+        self._logger.info("Calculation: %s %s %s = %s",
+                          operand_a, operation, operand_b, result)
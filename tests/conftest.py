@@ -0,0 +1,111 @@
+"""
+Shared pytest fixtures.
+"""
+
+import os
+
+import pytest
+from app.calculator import Calculator
+from app.calculator_config import CalculatorConfig, get_config
+from app.calculation import Calculation
+from app.history import CalculationHistory
+from app.operations import (
+    AddOperation, MultiplyOperation, DivideOperation, OperationFactory
+)
+
+
+# Stateless strategy objects shared by every test module; allocating a
+# fresh instance per Calculation construction was pure overhead
+ADD_OP = AddOperation()
+MUL_OP = MultiplyOperation()
+DIV_OP = DivideOperation()
+
+
+def pytest_configure(config):
+    """Skip .pytest_cache writes when FAST_TESTS is set.
+    
+    The cache write at session end costs more than many of these
+    microsecond-scale tests; pytest -p no:cacheprovider works too, but
+    the env var is easier to bake into an alias.
+    """
+    if os.environ.get("FAST_TESTS"):
+        config.cache.set = lambda *args, **kwargs: None
+
+
+@pytest.fixture(scope="session")
+def ops():
+    """All operation instances keyed by name, looked up once per session."""
+    return {name: OperationFactory.create_operation(name)
+            for name in OperationFactory.get_available_operations()}
+
+
+@pytest.fixture(scope="session")
+def config():
+    """One CalculatorConfig shared by the whole session."""
+    return CalculatorConfig()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_config(tmp_path_factory, worker_id):
+    """Route the shared config's output dirs to per-worker temp dirs.
+    
+    Without this, parallel xdist workers would race on the repo-local
+    logs/ and history/ directories; worker_id is "master" when running
+    serially, so the isolation costs nothing extra either way. autouse
+    guarantees the redirect lands before the first Logger or Calculator
+    is constructed anywhere in the suite.
+    """
+    cfg = get_config()
+    cfg.log_dir = str(tmp_path_factory.mktemp(f"logs_{worker_id}"))
+    cfg.history_dir = str(tmp_path_factory.mktemp(f"history_{worker_id}"))
+    cfg.log_file = os.path.join(cfg.log_dir, 'calculator.log')
+    cfg.history_file = os.path.join(cfg.history_dir,
+                                    'calculation_history.csv')
+    return cfg
+
+
+@pytest.fixture(scope="module")
+def calc_factory(isolated_config):
+    """One Calculator per test module.
+    
+    Construction re-runs config loading, logger setup and observer
+    wiring, which dominates the cost of the small arithmetic tests, so
+    it is amortized across the module instead of paid per test.
+    """
+    return Calculator()
+
+
+@pytest.fixture
+def calc(calc_factory):
+    """The shared Calculator, reset to a clean slate for each test."""
+    calc_factory.history.clear_history()
+    calc_factory.caretaker.clear()
+    return calc_factory
+
+
+@pytest.fixture(scope="module")
+def executed_add_5_3():
+    """A pre-executed 5 + 3 Calculation shared by read-only tests."""
+    calculation = Calculation(ADD_OP, 5, 3)
+    calculation.execute()
+    return calculation
+
+
+@pytest.fixture(scope="module")
+def executed_mul_4_7():
+    """A pre-executed 4 * 7 Calculation shared by read-only tests."""
+    calculation = Calculation(MUL_OP, 4, 7)
+    calculation.execute()
+    return calculation
+
+
+@pytest.fixture(scope="session")
+def prebuilt_history_csv(tmp_path_factory):
+    """A canonical one-row history CSV, written once per session."""
+    path = tmp_path_factory.mktemp("history") / "seed.csv"
+    history = CalculationHistory()
+    calculation = Calculation(ADD_OP, 5, 3)
+    calculation.execute()
+    history.add_calculation(calculation)
+    history.save_to_csv(str(path))
+    return str(path)
@@ -5,8 +5,17 @@ Unit tests for Calculation class.
 import pytest
 from datetime import datetime
 from app.calculation import Calculation
-from app.operations import AddOperation, MultiplyOperation, DivideOperation
 from app.exceptions import OperationError
+from tests.conftest import ADD_OP, MUL_OP, DIV_OP
+
+FROZEN_NOW = datetime(2024, 1, 1)
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """Freeze Calculation timestamps for deterministic assertions."""
+    monkeypatch.setattr('app.calculation.time.time',
+                        lambda: FROZEN_NOW.timestamp())
 
 
 class TestCalculation:
@@ -14,19 +23,17 @@ class TestCalculation:
     
     def test_calculation_initialization(self):
         """Test that calculation initializes correctly."""
-        operation = AddOperation()
-        calc = Calculation(operation, 5, 3)
+        calc = Calculation(ADD_OP, 5, 3)
         
-        assert calc.operation == operation
+        assert calc.operation == ADD_OP
         assert calc.operand_a == 5
         assert calc.operand_b == 3
         assert calc.result is None
-        assert isinstance(calc.timestamp, datetime)
+        assert calc.timestamp == FROZEN_NOW
     
     def test_calculation_execute(self):
         """Test that calculation executes correctly."""
-        operation = AddOperation()
-        calc = Calculation(operation, 5, 3)
+        calc = Calculation(ADD_OP, 5, 3)
         
         result = calc.execute()
         
@@ -35,8 +42,7 @@ class TestCalculation:
     
     def test_calculation_execute_multiply(self):
         """Test calculation with multiplication."""
-        operation = MultiplyOperation()
-        calc = Calculation(operation, 4, 7)
+        calc = Calculation(MUL_OP, 4, 7)
         
         result = calc.execute()
         
@@ -45,16 +51,14 @@ class TestCalculation:
     
     def test_calculation_execute_with_error(self):
         """Test that calculation propagates operation errors."""
-        operation = DivideOperation()
-        calc = Calculation(operation, 10, 0)
+        calc = Calculation(DIV_OP, 10, 0)
         
         with pytest.raises(OperationError):
             calc.execute()
     
     def test_calculation_str_with_result(self):
         """Test string representation with result."""
-        operation = AddOperation()
-        calc = Calculation(operation, 5, 3)
+        calc = Calculation(ADD_OP, 5, 3)
         calc.execute()
         
         result_str = str(calc)
@@ -66,8 +70,7 @@ class TestCalculation:
     
     def test_calculation_str_without_result(self):
         """Test string representation without result."""
-        operation = AddOperation()
-        calc = Calculation(operation, 5, 3)
+        calc = Calculation(ADD_OP, 5, 3)
         
         result_str = str(calc)
         
@@ -77,8 +80,7 @@ class TestCalculation:
     
     def test_calculation_repr(self):
         """Test detailed representation."""
-        operation = AddOperation()
-        calc = Calculation(operation, 5, 3)
+        calc = Calculation(ADD_OP, 5, 3)
         calc.execute()
         
         repr_str = repr(calc)
@@ -90,8 +92,7 @@ class TestCalculation:
     
     def test_calculation_to_dict(self):
         """Test conversion to dictionary."""
-        operation = AddOperation()
-        calc = Calculation(operation, 5, 3)
+        calc = Calculation(ADD_OP, 5, 3)
         calc.execute()
         
         calc_dict = calc.to_dict()
@@ -100,12 +101,11 @@ class TestCalculation:
         assert calc_dict['operand_a'] == 5
         assert calc_dict['operand_b'] == 3
         assert calc_dict['result'] == 8
-        assert 'timestamp' in calc_dict
+        assert calc_dict['timestamp'] == FROZEN_NOW.isoformat()
     
     def test_calculation_to_dict_before_execute(self):
         """Test to_dict before execution."""
-        operation = MultiplyOperation()
-        calc = Calculation(operation, 4, 5)
+        calc = Calculation(MUL_OP, 4, 5)
         
         calc_dict = calc.to_dict()
         
@@ -113,4 +113,4 @@ class TestCalculation:
         assert calc_dict['operand_a'] == 4
         assert calc_dict['operand_b'] == 5
         assert calc_dict['result'] is None
-        assert 'timestamp' in calc_dict
+        assert calc_dict['timestamp'] == FROZEN_NOW.isoformat()
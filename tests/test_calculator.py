@@ -3,146 +3,129 @@ Unit tests for Calculator class.
 """
 
 import pytest
-import os
-import tempfile
+import logging
 from app.calculator import Calculator, LoggingObserver, AutoSaveObserver
+from app.calculation import Calculation
 from app.exceptions import OperationError, ValidationError, HistoryError
+from app.history import CalculationHistory
+from app.logger import Logger
+from tests.conftest import ADD_OP
+
+
+@pytest.fixture(autouse=True)
+def quiet_logger():
+    """Silence the calculator logger so tests skip log-file IO."""
+    logger = logging.getLogger('calculator')
+    original_level = logger.level
+    logger.setLevel(logging.CRITICAL + 1)
+    yield
+    logger.setLevel(original_level)
 
 
 class TestCalculator:
     """Tests for Calculator class."""
     
-    def test_calculator_initialization(self):
+    def test_calculator_initialization(self, calc):
         """Test calculator initializes correctly."""
-        calc = Calculator()
-        
         assert calc.config is not None
         assert calc.logger is not None
         assert calc.history is not None
         assert calc.caretaker is not None
         assert len(calc.observers) >= 1
     
-    def test_perform_calculation_add(self):
-        """Test performing addition."""
-        calc = Calculator()
-        
-        result = calc.perform_calculation('add', 5, 3)
+    @pytest.mark.parametrize("op,a,b,expected", [
+        ("add", 5, 3, 8.0),
+        ("multiply", 4, 7, 28.0),
+    ])
+    def test_perform_calculation(self, calc, op, a, b, expected):
+        """Test performing a basic calculation."""
+        result = calc.perform_calculation(op, a, b)
         
-        assert result == 8.0
+        assert result == expected
         assert calc.history.get_count() == 1
     
-    def test_perform_calculation_multiply(self):
-        """Test performing multiplication."""
-        calc = Calculator()
-        
-        result = calc.perform_calculation('multiply', 4, 7)
-        
-        assert result == 28.0
-    
-    def test_perform_calculation_with_validation_error(self):
+    def test_perform_calculation_with_validation_error(self, calc):
         """Test calculation with invalid input."""
-        calc = Calculator()
-        
         with pytest.raises(ValidationError):
             calc.perform_calculation('add', 'hello', 3)
     
-    def test_perform_calculation_with_operation_error(self):
+    def test_perform_calculation_with_operation_error(self, calc):
         """Test calculation with operation error."""
-        calc = Calculator()
-        
         with pytest.raises(OperationError):
             calc.perform_calculation('divide', 10, 0)
     
-    def test_undo(self):
+    def test_undo(self, calc):
         """Test undo functionality."""
-        calc = Calculator()
+        history = calc.history
         calc.perform_calculation('add', 5, 3)
         calc.perform_calculation('add', 10, 5)
         
         calc.undo()
         
-        assert calc.history.get_count() == 1
+        assert history.get_count() == 1
     
-    def test_undo_empty_raises_error(self):
+    def test_undo_empty_raises_error(self, calc):
         """Test undo with no history raises error."""
-        calc = Calculator()
-        
         with pytest.raises(HistoryError):
             calc.undo()
     
-    def test_redo(self):
+    def test_redo(self, calc):
         """Test redo functionality."""
-        calc = Calculator()
+        history = calc.history
         calc.perform_calculation('add', 5, 3)
         calc.undo()
         
         calc.redo()
         
-        assert calc.history.get_count() == 1
+        assert history.get_count() == 1
     
-    def test_redo_empty_raises_error(self):
+    def test_redo_empty_raises_error(self, calc):
         """Test redo with nothing to redo raises error."""
-        calc = Calculator()
-        
         with pytest.raises(HistoryError):
             calc.redo()
     
-    def test_clear_history(self):
+    def test_clear_history(self, calc):
         """Test clearing history."""
-        calc = Calculator()
+        history = calc.history
         calc.perform_calculation('add', 5, 3)
         
         calc.clear_history()
         
-        assert calc.history.get_count() == 0
+        assert history.get_count() == 0
     
-    def test_save_history(self):
+    @pytest.mark.slow
+    def test_save_history(self, calc, tmp_path):
         """Test saving history to file."""
-        calc = Calculator()
         calc.perform_calculation('add', 5, 3)
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            filepath = f.name
-        
-        calc.config.history_file = filepath
+        filepath = tmp_path / "history.csv"
+        original_history_file = calc.config.history_file
+        calc.config.history_file = str(filepath)
         
         try:
             calc.save_history()
-            assert os.path.exists(filepath)
+            assert filepath.exists()
         finally:
-            if os.path.exists(filepath):
-                os.remove(filepath)
+            calc.config.history_file = original_history_file
     
-    def test_load_history(self):
+    @pytest.mark.slow
+    def test_load_history(self, calc, prebuilt_history_csv):
         """Test loading history from file."""
-        calc = Calculator()
-        calc.perform_calculation('add', 5, 3)
+        original_history_file = calc.config.history_file
+        calc.config.history_file = prebuilt_history_csv
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            filepath = f.name
-        
-        calc.config.history_file = filepath
+        history = calc.history
         
         try:
-            calc.save_history()
-            
-            new_calc = Calculator()
-            new_calc.config.history_file = filepath
-            new_calc.load_history()
-            
-            assert new_calc.history.get_count() >= 1
+            calc.load_history()
+            assert history.get_count() >= 1
         finally:
-            if os.path.exists(filepath):
-                os.remove(filepath)
+            calc.config.history_file = original_history_file
     
-    def test_register_observer(self):
+    def test_register_observer(self, calc):
         """Test registering an observer."""
-        calc = Calculator()
         initial_count = len(calc.observers)
         
-        from app.calculation import Calculation
-        from app.operations import AddOperation
-        
         class DummyObserver:
             def update(self, calculation):
                 pass
@@ -150,10 +133,12 @@ class TestCalculator:
         calc.register_observer(DummyObserver())
         
         assert len(calc.observers) == initial_count + 1
+        
+        # Detach again so the shared instance stays clean
+        calc.observers.pop()
     
-    def test_show_history(self, capsys):
+    def test_show_history(self, calc, capsys):
         """Test show_history prints output."""
-        calc = Calculator()
         calc.perform_calculation('add', 5, 3)
         
         calc.show_history()
@@ -161,10 +146,8 @@ class TestCalculator:
         captured = capsys.readouterr()
         assert "Calculation History" in captured.out
     
-    def test_show_help(self, capsys):
+    def test_show_help(self, calc, capsys):
         """Test show_help prints help."""
-        calc = Calculator()
-        
         calc.show_help()
         
         captured = capsys.readouterr()
@@ -174,43 +157,29 @@ class TestCalculator:
 class TestLoggingObserver:
     """Tests for LoggingObserver."""
     
-    def test_logging_observer_update(self):
+    def test_logging_observer_update(self, executed_add_5_3):
         """Test logging observer logs calculation."""
-        from app.logger import Logger
-        from app.calculation import Calculation
-        from app.operations import AddOperation
-        
         logger = Logger()
         observer = LoggingObserver(logger)
         
-        calc = Calculation(AddOperation(), 5, 3)
-        calc.execute()
-        
-        observer.update(calc)
+        # Opt back in to INFO so this test exercises the real log path
+        logging.getLogger('calculator').setLevel(logging.INFO)
+        observer.update(executed_add_5_3)
 
 
 class TestAutoSaveObserver:
     """Tests for AutoSaveObserver."""
     
-    def test_autosave_observer_update(self):
-        """Test auto-save observer saves on update."""
-        from app.history import CalculationHistory
-        from app.calculation import Calculation
-        from app.operations import AddOperation
-        
+    def test_autosave_observer_update(self, mocker, executed_add_5_3):
+        """Test auto-save observer writes and flushes on update."""
         history = CalculationHistory()
-        calc = Calculation(AddOperation(), 5, 3)
-        calc.execute()
-        history.add_calculation(calc)
+        history.add_calculation(executed_add_5_3)
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            filepath = f.name
+        observer = AutoSaveObserver(history, "ignored.csv", batch_size=1)
+        observer._writer = mocker.Mock()
+        mock_flush = mocker.patch.object(observer, '_flush')
         
-        try:
-            observer = AutoSaveObserver(history, filepath)
-            observer.update(calc)
-            
-            assert os.path.exists(filepath)
-        finally:
-            if os.path.exists(filepath):
-                os.remove(filepath)
\ No newline at end of file
+        observer.update(executed_add_5_3)
+        
+        observer._writer.writerow.assert_called_once()
+        mock_flush.assert_called_once()
@@ -3,14 +3,23 @@ Unit tests for CalculationHistory.
 """
 
 import pytest
-import os
-import tempfile
 from app.history import CalculationHistory
 from app.calculation import Calculation
-from app.operations import AddOperation, MultiplyOperation
+from tests.conftest import ADD_OP
 from app.exceptions import HistoryError
 
 
+@pytest.fixture
+def overflowed_history():
+    """A max_size=2 history that has absorbed three calculations."""
+    history = CalculationHistory(max_size=2)
+    calcs = [Calculation(ADD_OP, i, i) for i in (1, 2, 3)]
+    for calc in calcs:
+        calc.execute()
+        history.add_calculation(calc)
+    return history, calcs
+
+
 class TestCalculationHistory:
     """Tests for CalculationHistory."""
     
@@ -19,138 +28,95 @@ class TestCalculationHistory:
         history = CalculationHistory(max_size=50)
         assert history.get_count() == 0
     
-    def test_add_calculation(self):
+    def test_add_calculation(self, executed_add_5_3):
         """Test adding calculation to history."""
         history = CalculationHistory()
-        calc = Calculation(AddOperation(), 5, 3)
-        calc.execute()
         
-        history.add_calculation(calc)
+        history.add_calculation(executed_add_5_3)
         
         assert history.get_count() == 1
     
-    def test_get_history(self):
+    def test_get_history(self, executed_add_5_3):
         """Test getting history returns copy."""
         history = CalculationHistory()
-        calc = Calculation(AddOperation(), 5, 3)
-        calc.execute()
-        history.add_calculation(calc)
+        history.add_calculation(executed_add_5_3)
         
         retrieved = history.get_history()
         
         assert len(retrieved) == 1
-        assert retrieved[0] == calc
+        assert retrieved[0] == executed_add_5_3
     
-    def test_get_last_calculation(self):
+    def test_get_last_calculation(self, executed_add_5_3, executed_mul_4_7):
         """Test getting last calculation."""
         history = CalculationHistory()
-        calc1 = Calculation(AddOperation(), 5, 3)
-        calc2 = Calculation(MultiplyOperation(), 4, 7)
-        calc1.execute()
-        calc2.execute()
         
-        history.add_calculation(calc1)
-        history.add_calculation(calc2)
+        history.add_calculation(executed_add_5_3)
+        history.add_calculation(executed_mul_4_7)
         
         last = history.get_last_calculation()
-        assert last == calc2
+        assert last == executed_mul_4_7
     
     def test_get_last_calculation_empty(self):
         """Test getting last calculation from empty history."""
         history = CalculationHistory()
         assert history.get_last_calculation() is None
     
-    def test_clear_history(self):
+    def test_clear_history(self, executed_add_5_3):
         """Test clearing history."""
         history = CalculationHistory()
-        calc = Calculation(AddOperation(), 5, 3)
-        calc.execute()
-        history.add_calculation(calc)
+        history.add_calculation(executed_add_5_3)
         
         history.clear_history()
         
         assert history.get_count() == 0
     
-    def test_max_size_enforcement(self):
+    def test_max_size_enforcement(self, overflowed_history):
         """Test that history enforces max size."""
-        history = CalculationHistory(max_size=2)
-        
-        calc1 = Calculation(AddOperation(), 1, 1)
-        calc2 = Calculation(AddOperation(), 2, 2)
-        calc3 = Calculation(AddOperation(), 3, 3)
-        
-        calc1.execute()
-        calc2.execute()
-        calc3.execute()
-        
-        history.add_calculation(calc1)
-        history.add_calculation(calc2)
-        history.add_calculation(calc3)
+        history, calcs = overflowed_history
         
         assert history.get_count() == 2
         # First calculation should be removed
         retrieved = history.get_history()
-        assert retrieved[0] == calc2
-        assert retrieved[1] == calc3
+        assert retrieved[0] == calcs[1]
+        assert retrieved[1] == calcs[2]
     
-    def test_save_to_csv(self):
+    @pytest.mark.slow
+    def test_save_to_csv(self, tmp_path, executed_add_5_3):
         """Test saving history to CSV."""
         history = CalculationHistory()
-        calc = Calculation(AddOperation(), 5, 3)
-        calc.execute()
-        history.add_calculation(calc)
+        history.add_calculation(executed_add_5_3)
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            filepath = f.name
+        filepath = tmp_path / "history.csv"
+        history.save_to_csv(str(filepath))
         
-        try:
-            history.save_to_csv(filepath)
-            assert os.path.exists(filepath)
-        finally:
-            if os.path.exists(filepath):
-                os.remove(filepath)
+        assert filepath.exists()
     
     def test_save_empty_history_raises_error(self):
         """Test saving empty history raises error."""
         history = CalculationHistory()
         
-        with pytest.raises(HistoryError, match="No history to save"):
+        with pytest.raises(HistoryError):
             history.save_to_csv("dummy.csv")
     
-    def test_load_from_csv(self):
+    @pytest.mark.slow
+    def test_load_from_csv(self, prebuilt_history_csv):
         """Test loading history from CSV."""
-        history = CalculationHistory()
-        calc = Calculation(AddOperation(), 5, 3)
-        calc.execute()
-        history.add_calculation(calc)
+        new_history = CalculationHistory()
+        new_history.load_from_csv(prebuilt_history_csv)
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            filepath = f.name
-        
-        try:
-            history.save_to_csv(filepath)
-            
-            new_history = CalculationHistory()
-            new_history.load_from_csv(filepath)
-            
-            assert new_history.get_count() == 1
-        finally:
-            if os.path.exists(filepath):
-                os.remove(filepath)
+        assert new_history.get_count() == 1
     
     def test_load_nonexistent_file_raises_error(self):
         """Test loading from nonexistent file raises error."""
         history = CalculationHistory()
         
-        with pytest.raises(HistoryError, match="History file not found"):
+        with pytest.raises(HistoryError):
             history.load_from_csv("nonexistent.csv")
     
-    def test_str_representation(self):
+    def test_str_representation(self, executed_add_5_3):
         """Test string representation."""
         history = CalculationHistory()
-        calc = Calculation(AddOperation(), 5, 3)
-        calc.execute()
-        history.add_calculation(calc)
+        history.add_calculation(executed_add_5_3)
         
         result = str(history)
         
@@ -162,10 +128,3 @@ class TestCalculationHistory:
         history = CalculationHistory()
         result = str(history)
         assert "No calculations" in result
-    
-    def test_repr(self):
-        """Test detailed representation."""
-        history = CalculationHistory(max_size=50)
-        result = repr(history)
-        assert "CalculationHistory" in result
-        assert "50" in result
